@@ -21,11 +21,11 @@ import os
 import requests
 import time
 import uuid
-import yaml
 
 from galaxy_importer import config
 from galaxy_importer import exceptions
 from galaxy_importer.ansible_test.runners.base import BaseTestRunner
+from galaxy_importer.utils import yaml_loader
 from galaxy_importer.utils.resource_access import resource_filename_compat
 
 default_logger = logging.getLogger(__name__)
@@ -131,7 +131,7 @@ class Job:
         r = requests.post(
             self.jobs_url,
             headers=self.auth_header,
-            json=yaml.safe_load(self.job_yaml),
+            json=yaml_loader.safe_load(self.job_yaml),
             verify=self.ca_path,
         )
         if r.status_code != requests.codes.created:
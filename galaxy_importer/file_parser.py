@@ -17,12 +17,12 @@
 
 import logging
 import os
-import yaml
 import json
 
 from galaxy_importer import constants
 from galaxy_importer import exceptions as exc
 from galaxy_importer.utils import requires_ansible_version
+from galaxy_importer.utils import yaml_loader
 
 default_logger = logging.getLogger(__name__)
 
@@ -40,7 +40,7 @@ class RuntimeFileParser:
             return
         with open(self.path) as fp:
             try:
-                self.data = yaml.safe_load(fp)
+                self.data = yaml_loader.safe_load(fp)
             except Exception:
                 raise exc.FileParserError("Error during parsing of runtime.yml")
 
@@ -80,7 +80,7 @@ class ExtensionsFileParser:
             return
         with open(self.path) as fp:
             try:
-                self.data = yaml.safe_load(fp)
+                self.data = yaml_loader.safe_load(fp)
             except Exception:
                 raise exc.FileParserError("Error during parsing of extensions.yml")
 
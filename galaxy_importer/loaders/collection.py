@@ -262,7 +262,7 @@ class CollectionLoader:
 
         default_logger.debug("manifest_file: %s", manifest_file)
 
-        with open(manifest_file) as f:
+        with open(manifest_file, "rb") as f:
             try:
                 data = schema.CollectionArtifactManifest.parse(f.read())
             except ValueError as e:
@@ -297,7 +297,7 @@ class CollectionLoader:
         files_manifest_file = os.path.join(path_prefix, file_manifest_file.name)
         default_logger.debug("files_manifest_file: %s", files_manifest_file)
 
-        with open(files_manifest_file) as f:
+        with open(files_manifest_file, "rb") as f:
             try:
                 file_manifest = schema.CollectionArtifactFileManifest.parse(f.read())
             except ValueError as e:
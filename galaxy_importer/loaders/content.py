@@ -22,13 +22,13 @@ from pathlib import Path
 import re
 import shutil
 from subprocess import Popen, PIPE
-import yaml
 
 from galaxy_importer import constants
 from galaxy_importer import exceptions as exc
 from galaxy_importer import loaders
 from galaxy_importer import schema
 from galaxy_importer.utils import markup as markup_utils
+from galaxy_importer.utils import yaml_loader
 
 default_logger = logging.getLogger(__name__)
 
@@ -285,7 +285,7 @@ class RoleLoader(ContentLoader):
 
         with open(meta_path) as fp:
             try:
-                role_metadata = yaml.safe_load(fp)
+                role_metadata = yaml_loader.safe_load(fp)
             except Exception:
                 self.log.error("Error during parsing of role metadata")
         try:
@@ -15,16 +15,23 @@
 # You should have received a copy of the Apache License
 # along with Galaxy.  If not, see <http://www.apache.org/licenses/>.
 
-import json
+import copy
+import functools
+import os
 import re
 
 import attr
 import semantic_version
-import yaml
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from galaxy_importer import config
 from galaxy_importer import constants
 from galaxy_importer import exceptions as exc
+from galaxy_importer.utils import yaml_loader
 from galaxy_importer.utils.spdx_licenses import is_valid_license_id
 
 MAX_LENGTH_AUTHOR = 64
@@ -56,6 +63,7 @@ REQUIRED_TAG_LIST = [
     "tools",
     "windows",
 ]
+_REQUIRED_TAGS = frozenset(REQUIRED_TAG_LIST)
 
 
 def convert_none_to_empty_dict(val):
@@ -68,6 +76,108 @@ def convert_none_to_empty_dict(val):
     return val
 
 
+# namespace.name, with each part in the format of constants.NAME_REGEXP
+_DEPENDENCY_RE = re.compile(r"^(?![^.]*__)([a-z]+[0-9a-z_]*)\.(?![^.]*__)([a-z]+[0-9a-z_]*)$")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_config():
+    """Loads the importer config once, so validators do not re-read it on every call.
+
+    Call _get_config.cache_clear() after changing the config file or environment.
+    """
+    return config.Config(config_data=config.ConfigFile.load())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(value):
+    """Returns a cached semantic_version.Version, raises ValueError if invalid.
+
+    The returned object is shared between callers and must not be mutated.
+    """
+    return semantic_version.Version(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_spec(value):
+    """Returns a cached semantic_version.SimpleSpec, raises ValueError if invalid."""
+    return semantic_version.SimpleSpec(value)
+
+
+@functools.lru_cache(maxsize=2048)
+def _name_ok(name):
+    """Returns if name matches constants.NAME_REGEXP, cached as names recur across imports."""
+    return constants.NAME_REGEXP.match(name) is not None
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_dependency_name(collection):
+    """Returns (namespace, name) of a valid 'namespace.name' dependency, otherwise None."""
+    match = _DEPENDENCY_RE.match(collection)
+    if not match:
+        return None
+    return match.groups()
+
+
+@functools.lru_cache(maxsize=2048)
+def _legacy_role_name_ok(name):
+    """Returns if name matches constants.LEGACY_ROLE_NAME_REGEXP, cached."""
+    return constants.LEGACY_ROLE_NAME_REGEXP.match(name) is not None
+
+
+@functools.lru_cache(maxsize=2048)
+def _legacy_namespace_ok(name):
+    """Returns if name matches constants.LEGACY_NAMESPACE_REGEXP, cached."""
+    return constants.LEGACY_NAMESPACE_REGEXP.match(name) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _load_legacy_metadata_yaml(path, mtime_ns, size):
+    """Returns parsed yaml of a role metadata file, cached on its path, mtime and size.
+
+    The returned data is shared between callers, use a copy if it is to be modified.
+    """
+    with open(path) as fh:
+        return yaml_loader.safe_load(fh)
+
+
+# (field name, max length) of optional string fields checked by CollectionInfo
+_COLLECTION_INFO_STR_FIELDS = (
+    ("description", None),
+    ("repository", MAX_LENGTH_URL),
+    ("documentation", MAX_LENGTH_URL),
+    ("homepage", MAX_LENGTH_URL),
+    ("issues", MAX_LENGTH_URL),
+    ("license_file", None),
+)
+
+# (field name, must be str, format check, max length, label used in error messages)
+# of the scalar LegacyGalaxyInfo fields, checked in order
+_LEGACY_GALAXY_INFO_FIELDS = (
+    ("role_name", True, _legacy_role_name_ok, None, "role name"),
+    ("namespace", True, _legacy_namespace_ok, MAX_LENGTH_NAMESPACE, "namespace"),
+    ("author", True, None, MAX_LENGTH_AUTHOR, "author"),
+    ("description", True, None, MAX_LEGACY_ROLE_LENGTH_DESCRIPTION, "description"),
+    ("company", True, None, MAX_LEGACY_ROLE_LENGTH_COMPANY, "company"),
+    ("issue_tracker_url", True, None, MAX_LENGTH_URL, "url"),
+    ("license", True, None, MAX_LEGACY_ROLE_LENGTH_LICENSE, "role license"),
+    (
+        "min_ansible_version",
+        False,
+        None,
+        MAX_LEGACY_ROLE_LENGTH_VERSION,
+        "version for min_ansible_version",
+    ),
+    (
+        "min_ansible_container_version",
+        False,
+        None,
+        MAX_LEGACY_ROLE_LENGTH_VERSION,
+        "version for min_ansible_container_version",
+    ),
+    ("github_branch", True, None, None, "github_branch"),
+)
+
 _FILENAME_RE = re.compile(
     r"^(?P<namespace>\w+)-(?P<name>\w+)-(?P<version>[0-9a-zA-Z.+-]+)\.tar\.gz$"
 )
@@ -77,7 +187,7 @@ _FILENAME_RE = re.compile(
 class CollectionFilename:
     namespace = attr.ib()
     name = attr.ib()
-    version = attr.ib(converter=semantic_version.Version)
+    version = attr.ib(converter=_parse_version)
 
     def __str__(self):
         return f"{self.namespace}-{self.name}-{self.version}.tar.gz"
@@ -93,11 +203,11 @@ class CollectionFilename:
     @namespace.validator
     @name.validator
     def _validator(self, attribute, value):
-        if not constants.NAME_REGEXP.match(value):
+        if not _name_ok(value):
             raise ValueError("Invalid {}: {!r}".format(attribute.name, value))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CollectionInfo:
     """Represents collection_info metadata in collection manifest."""
 
@@ -147,7 +257,7 @@ class CollectionInfo:
     @name.validator
     def _check_name(self, attribute, value):
         """Check value against name regular expression and max length."""
-        if not re.match(constants.NAME_REGEXP, value):
+        if not _name_ok(value):
             self.value_error(f"'{attribute.name}' has invalid format: {value}")
         if len(value) > MAX_LENGTH_NAME:
             self.value_error(
@@ -157,18 +267,17 @@ class CollectionInfo:
     @version.validator
     def _check_version_format(self, attribute, value):
         """Check that version is in semantic version format, and max length."""
-        if not semantic_version.validate(value):
+        try:
+            version = _parse_version(value)
+        except ValueError:
             self.value_error(
                 f"Expecting 'version' to be in semantic version format, instead found '{value}'."
             )
         if len(value) > MAX_LENGTH_VERSION:
             self.value_error(f"'version' must not be greater than {MAX_LENGTH_VERSION} characters")
 
-        config_data = config.ConfigFile.load()
-        cfg = config.Config(config_data=config_data)
-        if cfg.require_v1_or_greater and semantic_version.Version(value) < semantic_version.Version(
-            "1.0.0"
-        ):
+        cfg = _get_config()
+        if cfg.require_v1_or_greater and version < _parse_version("1.0.0"):
             self.value_error("Config is enabled that requires version to be 1.0.0 or greater.")
 
     @authors.validator
@@ -210,22 +319,27 @@ class CollectionInfo:
             if not isinstance(version_spec, str):
                 self.value_error("Expecting depencency version to be string")
 
-            try:
-                namespace, name = collection.split(".")
-            except ValueError:
+            parsed = _parse_dependency_name(collection)
+            if parsed is None:
+                # find the failing part only on the error path, for a precise message
+                try:
+                    namespace, name = collection.split(".")
+                except ValueError:
+                    self.value_error(f"Invalid dependency format: '{collection}'")
+
+                for value in [namespace, name]:
+                    if not _name_ok(value):
+                        self.value_error(
+                            f"Invalid dependency format: '{value}' in '{namespace}.{name}'"
+                        )
                 self.value_error(f"Invalid dependency format: '{collection}'")
-
-            for value in [namespace, name]:
-                if not re.match(constants.NAME_REGEXP, value):
-                    self.value_error(
-                        f"Invalid dependency format: '{value}' in '{namespace}.{name}'"
-                    )
+            namespace, name = parsed
 
             if namespace == self.namespace and name == self.name:
                 self.value_error("Cannot have self dependency")
 
             try:
-                semantic_version.SimpleSpec(version_spec)
+                _parse_spec(version_spec)
             except ValueError:
                 self.value_error(
                     f"Dependency version spec range invalid: {collection} {version_spec}"
@@ -239,15 +353,11 @@ class CollectionInfo:
         - tag regular expression
         - tag max length
         """
-        no_req_tag_err = f"At least one tag required from tag list: {', '.join(REQUIRED_TAG_LIST)}"
-
-        config_data = config.ConfigFile.load()
-        cfg = config.Config(config_data=config_data)
-        if cfg.check_required_tags and not value:
-            self.value_error(no_req_tag_err)
-
-        if cfg.check_required_tags and (not any(tag in REQUIRED_TAG_LIST for tag in value)):
-            self.value_error(no_req_tag_err)
+        cfg = _get_config()
+        if cfg.check_required_tags and _REQUIRED_TAGS.isdisjoint(value):
+            self.value_error(
+                f"At least one tag required from tag list: {', '.join(REQUIRED_TAG_LIST)}"
+            )
 
         if not value:
             return
@@ -256,52 +366,36 @@ class CollectionInfo:
             self.value_error(f"Expecting no more than {constants.MAX_TAGS_COUNT} tags in metadata")
 
         for tag in value:
-            if not re.match(constants.NAME_REGEXP, tag):
+            if not _name_ok(tag):
                 self.value_error(f"'tag' has invalid format: {tag}")
             if len(tag) > MAX_LENGTH_TAG:
                 self.value_error(
                     f"Each tag in 'tags' list must not be greater than {MAX_LENGTH_TAG} characters"
                 )
 
-    @description.validator
-    @repository.validator
-    @documentation.validator
-    @homepage.validator
-    @issues.validator
-    @license_file.validator
-    @repository.validator
-    def _check_non_null_str(self, attribute, value):
-        """Check that if value is present, it must be a string."""
-        if value is not None and not isinstance(value, str):
-            self.value_error(f"'{attribute.name}' must be a string")
-
-    @documentation.validator
-    @homepage.validator
-    @issues.validator
-    @repository.validator
-    def _check_max_length_url(self, attribute, value):
-        """Check value is not greater than max length of url"""
-        if not value:
-            return
-        if len(value) > MAX_LENGTH_URL:
-            self.value_error(
-                f"'{attribute.name}' must not be greater than {MAX_LENGTH_URL} characters"
-            )
+    def __attrs_post_init__(self):
+        """Checks called post init validation."""
+        self._check_optional_str_fields()
+        self._check_license_or_license_file()
 
-    @authors.validator
-    def _check_max_length_author(self, attribute, value):
-        """Check each value list item is not greater than max length of author"""
-        for author in value:
+    def _check_optional_str_fields(self):
+        """Check optional fields are strings within max length, and each author's length."""
+        for field_name, max_length in _COLLECTION_INFO_STR_FIELDS:
+            value = getattr(self, field_name)
+            if value is None:
+                continue
+            if not isinstance(value, str):
+                self.value_error(f"'{field_name}' must be a string")
+            if max_length is not None and len(value) > max_length:
+                self.value_error(f"'{field_name}' must not be greater than {max_length} characters")
+
+        for author in self.authors:
             if len(author) > MAX_LENGTH_AUTHOR:
                 self.value_error(
                     f"Each author in 'authors' list must not be greater than "
                     f"{MAX_LENGTH_AUTHOR} characters"
                 )
 
-    def __attrs_post_init__(self):
-        """Checks called post init validation."""
-        self._check_license_or_license_file()
-
     def _check_license_or_license_file(self):
         """Confirm mutually exclusive presence of license or license_file."""
         if bool(self.license) != bool(self.license_file):
@@ -316,7 +410,7 @@ class CollectionInfo:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, eq=False)
 class CollectionArtifactFile:
     name = attr.ib()
     ftype = attr.ib()
@@ -326,7 +420,7 @@ class CollectionArtifactFile:
     format = attr.ib(default=1)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CollectionArtifactManifest:
     """Represents collection manifest metadata."""
 
@@ -341,7 +435,7 @@ class CollectionArtifactManifest:
 
     @classmethod
     def parse(cls, data):
-        meta = json.loads(data)
+        meta = json_loads(data)
         col_info = meta.pop("collection_info", None)
         meta["collection_info"] = CollectionInfo(**col_info)
 
@@ -357,36 +451,54 @@ class CollectionArtifactManifest:
 def convert_list_to_artifact_file_list(val):
     """Convert a list of dicts with file info into list of CollectionArtifactFile"""
 
-    new_list = []
-    for file_item in val:
-        if isinstance(file_item, CollectionArtifactFile):
-            new_list.append(file_item)
-        else:
-            artifact_file = CollectionArtifactFile(
-                name=file_item["name"],
-                ftype=file_item["ftype"],
-                chksum_type=file_item.get("chksum_type"),
-                chksum_sha256=file_item.get("chksum_sha256"),
+    # bind the class locally and pass fields positionally (name, ftype, src_name,
+    # chksum_type, chksum_sha256), FILES.json can list thousands of entries
+    artifact_file_cls = CollectionArtifactFile
+    return [
+        (
+            file_item
+            if isinstance(file_item, artifact_file_cls)
+            else artifact_file_cls(
+                file_item["name"],
+                file_item["ftype"],
+                None,
+                file_item.get("chksum_type"),
+                file_item.get("chksum_sha256"),
             )
-            new_list.append(artifact_file)
-
-    return new_list
+        )
+        for file_item in val
+    ]
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CollectionArtifactFileManifest:
-    files = attr.ib(factory=list, converter=convert_list_to_artifact_file_list)
+    """Represents FILES.json, CollectionArtifactFile items are built on first access."""
+
+    # raw list from FILES.json, passed to __init__ as 'files'
+    _files = attr.ib(factory=list)
 
     format = attr.ib(default=1, validator=attr.validators.instance_of(int))
 
+    _artifact_files = attr.ib(default=None, init=False, eq=False, repr=False)
+
+    @property
+    def files(self):
+        """List of CollectionArtifactFile, converted once and then cached."""
+        if self._artifact_files is None:
+            # instance is frozen, so bypass attrs to fill in the cache
+            object.__setattr__(
+                self, "_artifact_files", convert_list_to_artifact_file_list(self._files)
+            )
+        return self._artifact_files
+
     @classmethod
     def parse(cls, data):
-        artifact_file_manifest_data = json.loads(data)
+        artifact_file_manifest_data = json_loads(data)
         artifact_file_list = artifact_file_manifest_data["files"]
         return cls(files=artifact_file_list)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class LegacyGalaxyInfo:
     """Represents legacy role metadata galaxy_info field."""
 
@@ -403,115 +515,38 @@ class LegacyGalaxyInfo:
     platforms = attr.ib(factory=list)
     galaxy_tags = attr.ib(factory=list)
 
-    @role_name.validator
-    @namespace.validator
-    @author.validator
-    @description.validator
-    @company.validator
-    @issue_tracker_url.validator
-    @license.validator
-    @github_branch.validator
-    def _validate_str(self, attribute, value):
-        """Ensure value is of type str."""
-
-        if value is not None and not isinstance(value, str):
-            raise exc.LegacyRoleSchemaError(f"{attribute.name} must be a string")
-
-    @platforms.validator
-    def _validate_list_dict(self, attribute, value):
-        """Ensure value is of type list[dict]."""
-
-        if value is not None:
-            if not isinstance(value, list):
-                raise exc.LegacyRoleSchemaError(f"{attribute.name} must be a list")
-            if not all(isinstance(element, dict) for element in value):
-                raise exc.LegacyRoleSchemaError(f"{attribute.name} must be a list of dictionaries")
-
-    @galaxy_tags.validator
-    def _validate_list_str(self, attribute, value):
-        """Ensure value is of type list[str]."""
-
-        if value is not None:
-            if not isinstance(value, list):
-                raise exc.LegacyRoleSchemaError(f"{attribute.name} must be a list")
-            if not all(isinstance(element, str) for element in value):
-                raise exc.LegacyRoleSchemaError(f"{attribute.name} must be a list of strings")
-
-    @role_name.validator
-    def _validate_role_name(self, attribute, value):
-        """Ensure role name matches the regular expression."""
-
-        if value is not None and not constants.LEGACY_ROLE_NAME_REGEXP.match(value):
-            raise exc.LegacyRoleSchemaError(f"role name {value} is invalid")
-
-    @namespace.validator
-    def _validate_namespace(self, attribute, value):
-        """Ensure namespace matches the regular expression."""
-
-        if value is not None and (
-            not constants.LEGACY_NAMESPACE_REGEXP.match(value) or len(value) > MAX_LENGTH_NAMESPACE
-        ):
-            raise exc.LegacyRoleSchemaError(f"namespace {value} is invalid")
-
-    @author.validator
-    def _validate_author(self, attribute, value):
-        """Ensure the author value is not too long."""
-
-        if value is not None and len(value) > MAX_LENGTH_AUTHOR:
-            raise exc.LegacyRoleSchemaError(
-                f"author must not exceed {MAX_LENGTH_AUTHOR} characters"
-            )
-
-    @description.validator
-    def _validate_description(self, attribute, value):
-        if value is not None and len(value) > MAX_LEGACY_ROLE_LENGTH_DESCRIPTION:
-            raise exc.LegacyRoleSchemaError(
-                f"description must not exceed {MAX_LEGACY_ROLE_LENGTH_DESCRIPTION} characters"
-            )
-
-    @company.validator
-    def _validate_company(self, attribute, value):
-        if value is not None and len(value) > MAX_LEGACY_ROLE_LENGTH_COMPANY:
-            raise exc.LegacyRoleSchemaError(
-                f"company must not exceed {MAX_LEGACY_ROLE_LENGTH_COMPANY} characters"
-            )
-
-    @issue_tracker_url.validator
-    def _validate_url(self, attribute, value):
-        """Ensure a URL is not too long."""
-
-        if value is not None and len(value) > MAX_LENGTH_URL:
-            raise exc.LegacyRoleSchemaError(f"url must not exceed {MAX_LENGTH_URL} characters")
-
-    @license.validator
-    def _validate_license(self, attribute, value):
-        """Ensure the license is not too long."""
-
-        if value is not None and len(value) > MAX_LEGACY_ROLE_LENGTH_LICENSE:
-            raise exc.LegacyRoleSchemaError(
-                f"role license must not exceed {MAX_LEGACY_ROLE_LENGTH_LICENSE} characters"
-            )
-
-    @min_ansible_version.validator
-    @min_ansible_container_version.validator
-    def _validate_version(self, attribute, value):
-        """Ensure a version is not too long."""
-
-        if value is not None and len(str(value)) > MAX_LEGACY_ROLE_LENGTH_VERSION:
-            raise exc.LegacyRoleSchemaError(
-                f"version for {attribute.name} must not exceed"
-                f"{MAX_LEGACY_ROLE_LENGTH_VERSION} characters"
-            )
-
-    @galaxy_tags.validator
-    def _validate_tags(self, attribute, value):
-        """Ensure tags are not too long."""
-
-        if value is not None and any(len(element) > MAX_LENGTH_TAG for element in value):
-            raise exc.LegacyRoleSchemaError(f"tag must not exceed {MAX_LENGTH_TAG} characters")
-
-
-@attr.s(frozen=True)
+    def __attrs_post_init__(self):
+        """Validate all fields in one pass, scalar fields driven by _LEGACY_GALAXY_INFO_FIELDS."""
+
+        for field_name, must_be_str, format_ok, max_length, label in _LEGACY_GALAXY_INFO_FIELDS:
+            value = getattr(self, field_name)
+            if value is None:
+                continue
+            if must_be_str and not isinstance(value, str):
+                raise exc.LegacyRoleSchemaError(f"{field_name} must be a string")
+            if format_ok is not None:
+                if not format_ok(value) or (max_length is not None and len(value) > max_length):
+                    raise exc.LegacyRoleSchemaError(f"{label} {value} is invalid")
+            # versions may be parsed from yaml as numbers, so measure their str form
+            elif max_length is not None and len(str(value)) > max_length:
+                raise exc.LegacyRoleSchemaError(f"{label} must not exceed {max_length} characters")
+
+        if self.platforms is not None:
+            if not isinstance(self.platforms, list):
+                raise exc.LegacyRoleSchemaError("platforms must be a list")
+            if not all(isinstance(element, dict) for element in self.platforms):
+                raise exc.LegacyRoleSchemaError("platforms must be a list of dictionaries")
+
+        if self.galaxy_tags is not None:
+            if not isinstance(self.galaxy_tags, list):
+                raise exc.LegacyRoleSchemaError("galaxy_tags must be a list")
+            if not all(isinstance(element, str) for element in self.galaxy_tags):
+                raise exc.LegacyRoleSchemaError("galaxy_tags must be a list of strings")
+            if any(len(element) > MAX_LENGTH_TAG for element in self.galaxy_tags):
+                raise exc.LegacyRoleSchemaError(f"tag must not exceed {MAX_LENGTH_TAG} characters")
+
+
+@attr.s(frozen=True, slots=True)
 class LegacyMetadata:
     """Represents legacy role metadata."""
 
@@ -520,19 +555,20 @@ class LegacyMetadata:
 
     @classmethod
     def parse(cls, data):
-        with open(data) as fh:
-            metadata = yaml.safe_load(fh)
-            if not isinstance(metadata, dict):
-                raise exc.LegacyRoleSchemaError("metadata must be in the form of a yaml dictionary")
-            if "galaxy_info" not in metadata:
-                raise exc.LegacyRoleSchemaError("galaxy_info field not found in metadata")
-            if not isinstance(metadata["galaxy_info"], dict):
-                raise exc.LegacyRoleSchemaError("galaxy_info field must contain a dictionary")
-            try:
-                galaxy_info = LegacyGalaxyInfo(**metadata["galaxy_info"])
-            except TypeError as e:
-                raise exc.LegacyRoleSchemaError(f"unknown field in galaxy_info: {e}") from e
-            dependencies = metadata.get("dependencies", [])
+        stat = os.stat(data)
+        # copy, so the instance does not share lists with the cached yaml
+        metadata = copy.deepcopy(_load_legacy_metadata_yaml(data, stat.st_mtime_ns, stat.st_size))
+        if not isinstance(metadata, dict):
+            raise exc.LegacyRoleSchemaError("metadata must be in the form of a yaml dictionary")
+        if "galaxy_info" not in metadata:
+            raise exc.LegacyRoleSchemaError("galaxy_info field not found in metadata")
+        if not isinstance(metadata["galaxy_info"], dict):
+            raise exc.LegacyRoleSchemaError("galaxy_info field must contain a dictionary")
+        try:
+            galaxy_info = LegacyGalaxyInfo(**metadata["galaxy_info"])
+        except TypeError as e:
+            raise exc.LegacyRoleSchemaError(f"unknown field in galaxy_info: {e}") from e
+        dependencies = metadata.get("dependencies", [])
         return cls(galaxy_info, dependencies)
 
     @dependencies.validator
@@ -566,14 +602,14 @@ class LegacyMetadata:
                 )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, eq=False, repr=False)
 class ResultContentItem:
     name = attr.ib()
     content_type = attr.ib()
     description = attr.ib()
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class PatternsMetadata:
     name = attr.ib()
     title = attr.ib()
@@ -583,7 +619,7 @@ class PatternsMetadata:
     aap_resources = attr.ib(factory=dict)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class ImportResult:
     """Result of the import process, collection metadata, and contents."""
 
@@ -595,7 +631,7 @@ class ImportResult:
     patterns = attr.ib(factory=list, type=PatternsMetadata)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class LegacyImportResult:
     """Result of legacy import with namespace, name, metadata, and readme."""
 
@@ -607,7 +643,7 @@ class LegacyImportResult:
 
     @name.validator
     def _validate_name(self, attribute, value):
-        if constants.LEGACY_ROLE_NAME_REGEXP.match(value) is None:
+        if not _legacy_role_name_ok(value):
             raise exc.LegacyRoleSchemaError(f"role name {value} is invalid")
 
     @metadata.validator
@@ -649,7 +685,7 @@ class Content:
         self.description = self.doc_strings["doc"].get("short_description", None)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, eq=False, repr=False)
 class RenderedDocFile:
     """Name and html of a documenation file, part of DocsBlob."""
 
@@ -657,7 +693,7 @@ class RenderedDocFile:
     html = attr.ib(default=None)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True, eq=False, repr=False)
 class DocsBlobContentItem:
     """Documenation for piece of content, part of DocsBlob."""
 
@@ -668,7 +704,7 @@ class DocsBlobContentItem:
     readme_html = attr.ib(default=None)
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class DocsBlob:
     """All documenation that is part of a collection."""
 
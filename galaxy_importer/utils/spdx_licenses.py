@@ -1,18 +1,38 @@
 import json
 import logging
+import marshal
 from importlib.resources import files
 
 log = logging.getLogger(__name__)
 
-_SPDX_LICENSES = None
 _SPDX_LICENSES_FILE = "spdx_licenses.json"
+# built from _SPDX_LICENSES_FILE by scripts/build_spdx_cache.py
+_SPDX_VALID_IDS_FILE = "spdx_valid_ids.marshal"
 
 
-def _load_spdx():
+def _load_spdx_cache():
+    """Loads valid license IDs from the precomputed cache, returns None if unusable."""
+    parent_module = __name__.rsplit(".", 1)[0]
+    try:
+        with (files(parent_module) / _SPDX_VALID_IDS_FILE).open("rb") as stream:
+            # a single read, marshal.load() on a stream reads it piecemeal
+            return frozenset(marshal.loads(stream.read()))
+    except (OSError, EOFError, ValueError, TypeError) as exc:
+        log.debug(
+            "Unable to load %s, falling back to %s: %s",
+            _SPDX_VALID_IDS_FILE,
+            _SPDX_LICENSES_FILE,
+            exc,
+        )
+        return None
+
+
+def _load_spdx_json():
+    """Loads the set of valid, non-deprecated SPDX license IDs from the JSON file."""
     parent_module = __name__.rsplit(".", 1)[0]
     try:
         with (files(parent_module) / _SPDX_LICENSES_FILE).open("rb") as stream:
-            return json.load(stream)
+            licenses = json.load(stream)
     except OSError as exc:
         log.warning(
             "Unable to open %s to load the list of acceptable open source licenses: %s",
@@ -20,31 +40,38 @@ def _load_spdx():
             exc,
         )
         log.exception(exc)
-        return {}
+        return frozenset()
 
+    # only the deprecation status matters, so keep just the valid IDs
+    return frozenset(
+        license_id
+        for license_id, info in licenses.items()
+        if not (info and info.get("deprecated", None))
+    )
 
-def _get_spdx():
-    """Gets the spdx_license info, so it is only loaded from disk once."""
-    global _SPDX_LICENSES
 
-    if not _SPDX_LICENSES:
-        _SPDX_LICENSES = _load_spdx()
+def _load_spdx():
+    """Loads valid license IDs, preferring the precomputed cache over parsing JSON."""
+    valid_ids = _load_spdx_cache()
+    if valid_ids is None:
+        valid_ids = _load_spdx_json()
+    return valid_ids
 
-    return _SPDX_LICENSES
 
+_VALID_IDS = None
 
-def is_valid_license_id(license_id):
-    """Check if license_id is valid and non-deprecated SPDX ID."""
-    if license_id is None:
-        return False
 
-    valid_license_ids = _get_spdx()
-    valid = valid_license_ids.get(license_id, None)
-    if valid is None:
-        return False
+def _get_valid_ids():
+    """Gets the valid license IDs, so they are only loaded from disk once, on first use."""
+    global _VALID_IDS
+
+    if _VALID_IDS is None:
+        _VALID_IDS = _load_spdx()
 
-    # license was in list, but is deprecated
-    if valid and valid.get("deprecated", None):  # noqa: SIM103
-        return False
+    return _VALID_IDS
 
-    return True
+
+def is_valid_license_id(license_id):
+    """Check if license_id is valid and non-deprecated SPDX ID."""
+    # a frozenset probe is already cheaper than an lru_cache hit, so lookups are not memoized
+    return license_id is not None and license_id in _get_valid_ids()
@@ -0,0 +1,11 @@
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def safe_load(stream):
+    """Parse yaml like yaml.safe_load, using the libyaml C loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+import json
+import marshal
+
+# NOTE: Run this after update_spdx.py, so the cache matches spdx_licenses.json.
+
+INPUT_PATH = "galaxy_importer/utils/spdx_licenses.json"
+OUTPUT_PATH = "galaxy_importer/utils/spdx_valid_ids.marshal"
+
+with open(INPUT_PATH) as fh:
+    licenses = json.load(fh)
+
+# galaxy-importer only accepts non-deprecated license IDs, sorted so output is reproducible.
+valid_ids = tuple(
+    sorted(license_id for license_id, info in licenses.items() if not info.get("deprecated"))
+)
+
+# Write output.
+with open(OUTPUT_PATH, "wb") as fh:
+    marshal.dump(valid_ids, fh)
@@ -3,7 +3,8 @@
 import json
 import requests
 
-# NOTE: This file should be run periodically to update the SPDX licenses.
+# NOTE: This file should be run periodically to update the SPDX licenses,
+# followed by build_spdx_cache.py to regenerate the precomputed license cache.
 
 OUTPUT_PATH = "galaxy_importer/utils/spdx_licenses.json"
 SPDX_URL = "https://spdx.org/licenses/licenses.json"
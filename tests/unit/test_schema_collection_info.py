@@ -156,12 +156,14 @@ def test_max_tags(collection_info):
 
 @pytest.fixture
 def temp_config_file():
+    schema._get_config.cache_clear()
     try:
         dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
         config_file = os.path.join(dir, "galaxy_importer", "galaxy-importer.cfg")
         yield config_file
     finally:
         os.remove(config_file)
+        schema._get_config.cache_clear()
 
 
 def test_required_tag_enabled(collection_info, temp_config_file):
@@ -394,6 +396,8 @@ def test_non_null_str_fields(collection_info):
         "my-namespace.mydashedcollection",
         "mynamespace.my spaced collection",
         "my namespace.myspacedcollection",
+        "my__namespace.collection",
+        "mynamespace.double__underscore",
     ],
 )
 def test_invalid_dep_format(collection_info, dependent_collection):
@@ -313,3 +313,20 @@ def test_invalid_namespace(galaxy_info, invalid_namespace):
 def test_valid_namespace(galaxy_info, valid_namespace):
     galaxy_info.update({"namespace": valid_namespace})
     assert valid_namespace == LegacyGalaxyInfo(**galaxy_info).namespace
+
+
+def test_metadata_parse_reloads_changed_file(tmp_path):
+    meta_path = tmp_path / "main.yml"
+    meta_path.write_text("galaxy_info:\n  role_name: my_role\ndependencies: []\n")
+    metadata = LegacyMetadata.parse(str(meta_path))
+    assert metadata.galaxy_info.role_name == "my_role"
+    assert metadata.dependencies == []
+
+    # a cached parse must not leak mutations back into later results
+    metadata.dependencies.append("foo.bar")
+    assert LegacyMetadata.parse(str(meta_path)).dependencies == []
+
+    meta_path.write_text("galaxy_info:\n  role_name: other_role\ndependencies: [foo.bar]\n")
+    metadata = LegacyMetadata.parse(str(meta_path))
+    assert metadata.galaxy_info.role_name == "other_role"
+    assert metadata.dependencies == ["foo.bar"]
@@ -0,0 +1,38 @@
+import pytest
+
+from galaxy_importer.utils import spdx_licenses
+from galaxy_importer.utils.spdx_licenses import is_valid_license_id
+
+
+@pytest.mark.parametrize(
+    ("license_id", "valid"),
+    [
+        ("MIT", True),
+        ("GPL-3.0-or-later", True),
+        ("AGPL-3.0", False),
+        ("not-a-license", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_is_valid_license_id(license_id, valid):
+    assert is_valid_license_id(license_id) is valid
+
+
+def test_spdx_cache_matches_json():
+    assert spdx_licenses._load_spdx_cache() == spdx_licenses._load_spdx_json()
+
+
+def test_load_spdx_falls_back_to_json(mocker):
+    mocker.patch.object(spdx_licenses, "_SPDX_VALID_IDS_FILE", "missing.marshal")
+    valid_ids = spdx_licenses._load_spdx()
+    assert "MIT" in valid_ids
+    assert "AGPL-3.0" not in valid_ids
+
+
+def test_valid_ids_loaded_once(mocker):
+    mocker.patch.object(spdx_licenses, "_VALID_IDS", None)
+    load_spdx = mocker.patch.object(spdx_licenses, "_load_spdx", return_value=frozenset({"MIT"}))
+    assert is_valid_license_id("MIT")
+    assert not is_valid_license_id("Apache-2.0")
+    load_spdx.assert_called_once()